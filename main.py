@@ -4,8 +4,14 @@ import sys
 import json
 import logging
 import argparse
+import threading
+from bisect import bisect_left, bisect_right
+from concurrent.futures import Future, wait
 from datetime import datetime, timedelta
-from typing import List
+from operator import attrgetter
+from typing import List, Optional
+
+import requests
 
 # Add project root to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -14,7 +20,8 @@ from models.event import Event
 from scrapers.shelter import ShelterScraper
 from scrapers.radion import RadionScraper
 from scrapers.lofi import LofiScraper
-from utils.email_sender import send_email, save_events_json
+from scrapers.base_scraper import BaseScraper, create_session
+from utils.email_sender import send_email, save_events_json, close_smtp
 
 # Configure logging
 logging.basicConfig(
@@ -25,33 +32,64 @@ logger = logging.getLogger(__name__)
 
 
 class TechnoEventAggregator:
-    def __init__(self):
+    # Seconds to wait for each venue before reporting without it
+    venue_timeout = 120
+    
+    def __init__(self, session: Optional[requests.Session] = None):
         self.scrapers = [
-            ShelterScraper(),
-            RadionScraper(),
-            LofiScraper(),
+            ShelterScraper(session),
+            RadionScraper(session),
+            LofiScraper(session),
         ]
         
     def scrape_all_venues(self) -> List[Event]:
-        """Scrape events from all configured venues"""
-        all_events = []
-        
+        """Scrape events from all configured venues concurrently"""
+        # Venues live on independent hosts, so their network waits can overlap. Daemon
+        # threads rather than a ThreadPoolExecutor, whose workers are joined at interpreter
+        # exit: a venue still hanging after the timeout must not hold up the process either.
+        # Detail page pools a hung venue has already started are still joined at exit, but
+        # each of their fetches is bounded by request_timeout and the retry limit.
+        futures = {}
         for scraper in self.scrapers:
-            logger.info(f"Scraping {scraper.venue_name}...")
-            try:
-                events = scraper.scrape_events()
-                logger.info(f"Found {len(events)} events from {scraper.venue_name}")
-                all_events.extend(events)
-            except Exception as e:
-                logger.error(f"Error scraping {scraper.venue_name}: {e}")
-                
-        return all_events
+            future = Future()
+            futures[future] = scraper
+            threading.Thread(
+                target=self._scrape_venue_into, args=(scraper, future),
+                name=f"scrape-{scraper.venue_name}", daemon=True
+            ).start()
+            
+        done, not_done = wait(futures, timeout=self.venue_timeout)
+        
+        for future in not_done:
+            logger.error(f"Timed out scraping {futures[future].venue_name} after {self.venue_timeout}s")
+            
+        # Iterate futures rather than done to keep the configured venue order
+        return [event for future in futures if future in done for event in future.result()]
+            
+    def _scrape_venue_into(self, scraper: BaseScraper, future: Future):
+        """Scrape a single venue on a worker thread, publishing the events through future"""
+        future.set_result(self._scrape_venue(scraper))
+        
+    def _scrape_venue(self, scraper: BaseScraper) -> List[Event]:
+        """Scrape a single venue, logging failures so other venues still complete"""
+        logger.info(f"Scraping {scraper.venue_name}...")
+        try:
+            events = scraper.scrape_events()
+            logger.info(f"Found {len(events)} events from {scraper.venue_name}")
+            return events
+        except Exception as e:
+            logger.error(f"Error scraping {scraper.venue_name}: {e}")
+            return []
         
     def filter_upcoming_events(self, events: List[Event], days: int = 7) -> List[Event]:
         """Filter events to only include those in the next N days"""
-        cutoff_date = datetime.now() + timedelta(days=days)
-        upcoming = [e for e in events if datetime.now() <= e.date <= cutoff_date]
-        return sorted(upcoming, key=lambda e: e.date)
+        now = datetime.now()
+        cutoff_date = now + timedelta(days=days)
+        
+        # Sort once, then slice the window out with binary search on the dates
+        events = sorted(events, key=attrgetter('date'))
+        dates = [event.date for event in events]
+        return events[bisect_left(dates, now):bisect_right(dates, cutoff_date)]
         
     def deduplicate_events(self, events: List[Event]) -> List[Event]:
         """Remove duplicate events based on venue, name, and date"""
@@ -59,7 +97,7 @@ class TechnoEventAggregator:
         unique_events = []
         
         for event in events:
-            event_key = (event.venue, event.name.lower(), event.date.date())
+            event_key = event.dedup_key
             if event_key not in seen:
                 seen.add(event_key)
                 unique_events.append(event)
@@ -74,11 +112,14 @@ def main():
     parser.add_argument('--output', choices=['email', 'json', 'both'], default='json',
                        help='Output format (default: json)')
     parser.add_argument('--json-file', default='events.json', help='JSON output filename')
+    parser.add_argument('--cache-ttl', type=int, default=0,
+                       help='Cache fetched pages locally for this many seconds (default: 0, disabled)')
     
     args = parser.parse_args()
     
     # Initialize aggregator
-    aggregator = TechnoEventAggregator()
+    session = create_session(cache_ttl=args.cache_ttl) if args.cache_ttl > 0 else None
+    aggregator = TechnoEventAggregator(session)
     
     # Scrape all venues
     logger.info("Starting techno event aggregation...")
@@ -103,6 +144,7 @@ def main():
             logger.info("Running in GitHub Actions, using secrets for SMTP")
             
         success = send_email(upcoming_events, args.email)
+        close_smtp()
         if success:
             logger.info(f"Email sent to {args.email}")
         else:
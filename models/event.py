@@ -1,29 +1,58 @@
-from datetime import datetime
-from typing import Optional, List
-from pydantic import BaseModel, Field
+import sys
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from typing import Optional, List, Tuple
 
+# slots=True needs Python 3.10+; on 3.9 events simply keep an instance __dict__
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
 
-class Event(BaseModel):
+
+@dataclass(frozen=True, eq=False, **_SLOTS)
+class Event:
+    # Scrapers only construct events, so a plain frozen dataclass is enough; no per-field validation
     venue: str
     venue_url: str
     name: str
     date: datetime
     url: Optional[str] = None
-    artists: List[str] = Field(default_factory=list)
+    artists: List[str] = field(default_factory=list)
     price: Optional[str] = None
     description: Optional[str] = None
     
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
+    # Derived once at construction; the event is frozen so they cannot go stale
+    _dedup_key: Tuple[str, str, date] = field(init=False, repr=False)
+    _hash: int = field(init=False, repr=False)
+    
+    def __post_init__(self) -> None:
+        dedup_key = (self.venue, self.name.casefold(), self.date.date())
+        object.__setattr__(self, '_dedup_key', dedup_key)
+        object.__setattr__(self, '_hash', hash(dedup_key))
+    
+    @property
+    def dedup_key(self) -> Tuple[str, str, date]:
+        """Key identifying the same event regardless of name casing or start time"""
+        return self._dedup_key
+    
+    def to_dict(self) -> dict:
+        """JSON-ready representation with the date as an ISO 8601 string"""
+        return {
+            'venue': self.venue,
+            'venue_url': self.venue_url,
+            'name': self.name,
+            'date': self.date.isoformat(),
+            'url': self.url,
+            'artists': list(self.artists),
+            'price': self.price,
+            'description': self.description,
         }
     
     def __hash__(self):
-        return hash((self.venue, self.name, self.date.date()))
+        return self._hash
     
     def __eq__(self, other):
         if not isinstance(other, Event):
             return False
-        return (self.venue == other.venue and 
-                self.name == other.name and 
-                self.date.date() == other.date.date())
\ No newline at end of file
+        return self._dedup_key == other._dedup_key
+    
+    # Spelling used by callers written against the old pydantic model
+    dict = to_dict
\ No newline at end of file
@@ -1,45 +1,221 @@
+import re
+import json
 import time
+import random
 import logging
+import threading
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+from urllib.parse import urlsplit
 import requests
+import requests_cache
+from requests.adapters import HTTPAdapter
 from bs4 import BeautifulSoup
+from dateutil.parser import isoparse
+from dateutil.tz import gettz
 from models.event import Event
 
 
+class ThrottledAdapter(HTTPAdapter):
+    """HTTPAdapter that spaces out requests to the same host
+    
+    Throttling lives in the transport so responses served from a cache never wait.
+    """
+    
+    def __init__(self, min_interval: float = 1.0, **kwargs):
+        super().__init__(**kwargs)
+        self.min_interval = min_interval
+        self._last_request_at: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        
+    def send(self, request, **kwargs):
+        self._wait_for_host(urlsplit(request.url).netloc)
+        return super().send(request, **kwargs)
+        
+    def _wait_for_host(self, host: str):
+        """Rate limiting - only sleep if the same host was hit too recently"""
+        with self._lock:
+            now = time.monotonic()
+            delay = max(0.0, self._last_request_at.get(host, 0.0) + self.min_interval - now)
+            # Reserve the slot before sleeping so concurrent callers queue up behind it
+            self._last_request_at[host] = now + delay
+            
+        if delay:
+            time.sleep(delay)
+
+
+def create_session(cache_ttl: int = 0) -> requests.Session:
+    """Create an HTTP session for the scrapers
+    
+    Args:
+        cache_ttl: Seconds to keep responses in a local SQLite cache (0 disables caching)
+    """
+    if cache_ttl > 0:
+        # Re-runs within the TTL are answered from disk; venue Cache-Control headers still apply
+        session = requests_cache.CachedSession(
+            'techno_cache', backend='sqlite', expire_after=cache_ttl, cache_control=True
+        )
+    else:
+        session = requests.Session()
+        
+    # One pool per host, large enough for concurrent detail page fetches
+    adapter = ThrottledAdapter(pool_connections=8, pool_maxsize=32)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    session.headers.update({
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+    })
+    return session
+
+
+_TECHNO_KEYWORDS = [
+    'techno', 'tech-house', 'minimal', 'electronic', 'acid',
+    'industrial', 'rave', 'warehouse', 'underground', 'dub techno',
+    'hard techno', 'ambient techno', 'detroit techno'
+]
+
+# Whole-word lookup, so 'technology' no longer counts as 'techno'. The multi-word
+# keywords all contain 'techno' and are therefore covered by the single word.
+_TECHNO_WORDS = frozenset(keyword for keyword in _TECHNO_KEYWORDS if ' ' not in keyword)
+_WORD_RE = re.compile(r'[a-z]+(?:-[a-z]+)*')
+
+
+def _mentions_techno(text: Optional[str]) -> bool:
+    """Whether text contains any of the techno keywords, stopping at the first one"""
+    if not text:
+        return False
+        
+    for word in _WORD_RE.findall(text.lower()):
+        # Hyphenated words also match on their parts, e.g. 'acid-techno'
+        if word in _TECHNO_WORDS or ('-' in word and not _TECHNO_WORDS.isdisjoint(word.split('-'))):
+            return True
+    return False
+
+
+def _find_start_date(data: Any) -> Optional[str]:
+    """Find the first schema.org startDate in a decoded JSON-LD document"""
+    if isinstance(data, list):
+        for item in data:
+            start_date = _find_start_date(item)
+            if start_date:
+                return start_date
+    elif isinstance(data, dict):
+        if isinstance(data.get('startDate'), str):
+            return data['startDate']
+        return _find_start_date(data.get('@graph'))
+    return None
+
+
+# All venues are in Amsterdam; event dates are naive local wall-clock times
+_VENUE_TZ = gettz('Europe/Amsterdam')
+
+
+def _parse_iso_date(value: str) -> Optional[datetime]:
+    """Parse an ISO 8601 date as a naive Amsterdam wall-clock time"""
+    try:
+        parsed = isoparse(value.strip())
+    except ValueError:
+        return None
+    if parsed.tzinfo is not None:
+        # Convert before dropping the offset, so e.g. a UTC "Z" time isn't read as local
+        parsed = parsed.astimezone(_VENUE_TZ)
+    return parsed.replace(tzinfo=None)
+
+
+# Shared so keep-alive connections are reused across pages and venues
+_SHARED_SESSION = create_session()
+
+
 class BaseScraper(ABC):
-    def __init__(self, venue_name: str, venue_url: str):
+    # Maximum number of detail pages scraped at the same time
+    max_detail_workers = 10
+    # (connect, read) seconds; an unreachable host fails fast while slow pages can still load
+    request_timeout = (5, 30)
+
+    def __init__(self, venue_name: str, venue_url: str, session: Optional[requests.Session] = None,
+                 max_concurrency: int = 10):
         self.venue_name = venue_name
         self.venue_url = venue_url
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-        })
+        self.session = session if session is not None else _SHARED_SESSION
+        # Caps in-flight requests for this scraper, however many threads call fetch_page
+        self._request_slots = threading.BoundedSemaphore(max_concurrency)
         self.logger = logging.getLogger(f"{__name__}.{venue_name}")
         
     def fetch_page(self, url: str) -> Optional[BeautifulSoup]:
         """Fetch and parse a webpage with retry logic"""
         max_retries = 3
-        retry_delay = 2
+        retry_delay = 1.0
+        max_retry_delay = 30.0
         
         for attempt in range(max_retries):
             try:
                 self.logger.info(f"Fetching {url} (attempt {attempt + 1}/{max_retries})")
-                response = self.session.get(url, timeout=30)
+                with self._request_slots:
+                    response = self.session.get(url, timeout=self.request_timeout)
                 response.raise_for_status()
                 
-                # Rate limiting - wait 2 seconds between requests
-                time.sleep(2)
-                
-                return BeautifulSoup(response.content, 'lxml')
+                return BeautifulSoup(response.content, 'lxml', from_encoding=self._declared_encoding(response))
                 
             except requests.RequestException as e:
                 self.logger.error(f"Error fetching {url}: {e}")
-                if attempt < max_retries - 1:
-                    time.sleep(retry_delay * (attempt + 1))
-                else:
+                if attempt == max_retries - 1 or not self._is_retryable(e):
                     return None
                     
+                # Capped exponential backoff, jittered so concurrent scrapers don't retry in lockstep
+                delay = min(max_retry_delay, retry_delay * 2 ** attempt)
+                time.sleep(delay * (1 + random.uniform(0, 0.5)))
+                
+    @staticmethod
+    def _is_retryable(error: requests.RequestException) -> bool:
+        """Whether a failed request might succeed if repeated"""
+        response = error.response
+        if response is None:
+            # Connection errors and timeouts
+            return True
+        return response.status_code >= 500 or response.status_code in (408, 429)
+        
+    @staticmethod
+    def _declared_encoding(response: requests.Response) -> Optional[str]:
+        """Charset from the Content-Type header, so BeautifulSoup can skip sniffing the body"""
+        # requests falls back to ISO-8859-1 for text/* without a charset, which is not a real declaration
+        if 'charset=' in response.headers.get('Content-Type', '').lower():
+            return response.encoding
+        return None
+        
+    @staticmethod
+    def extract_structured_date(element) -> Optional[datetime]:
+        """Event start date from JSON-LD, <time datetime> or itemprop markup, if present"""
+        for script in element.find_all('script', type='application/ld+json'):
+            try:
+                start_date = _find_start_date(json.loads(script.string or ''))
+            except ValueError:
+                continue
+            parsed = _parse_iso_date(start_date) if start_date else None
+            if parsed:
+                return parsed
+                
+        time_elem = element.find('time', datetime=True)
+        if time_elem:
+            parsed = _parse_iso_date(time_elem['datetime'])
+            if parsed:
+                return parsed
+                
+        start_elem = element.find(attrs={'itemprop': 'startDate'})
+        value = start_elem and (start_elem.get('content') or start_elem.get('datetime'))
+        return _parse_iso_date(value) if value else None
+        
+    def scrape_concurrently(self, scrape_func: Callable[[str], Optional[Event]],
+                            urls: List[str]) -> List[Event]:
+        """Run scrape_func over urls in a bounded thread pool, dropping failed pages"""
+        if not urls:
+            return []
+            
+        with ThreadPoolExecutor(max_workers=min(self.max_detail_workers, len(urls))) as executor:
+            # map() keeps results in the same order as urls
+            return [event for event in executor.map(scrape_func, urls) if event]
+            
     @abstractmethod
     def scrape_events(self) -> List[Event]:
         """Scrape events from the venue website"""
@@ -47,20 +223,13 @@ class BaseScraper(ABC):
     
     def filter_techno_events(self, events: List[Event]) -> List[Event]:
         """Filter events to only include techno-related ones"""
-        techno_keywords = [
-            'techno', 'tech-house', 'minimal', 'electronic', 'acid',
-            'industrial', 'rave', 'warehouse', 'underground', 'dub techno',
-            'hard techno', 'ambient techno', 'detroit techno'
-        ]
-        
         filtered = []
         for event in events:
-            # Check event name and description for techno keywords
-            text_to_check = f"{event.name} {event.description or ''}".lower()
-            if any(keyword in text_to_check for keyword in techno_keywords):
-                filtered.append(event)
-            # Also check artist names
-            elif any(keyword in ' '.join(event.artists).lower() for keyword in techno_keywords):
+            # Check event name, description and artist names for techno keywords,
+            # stopping at the first field that matches
+            if (_mentions_techno(event.name) or
+                    _mentions_techno(event.description) or
+                    any(_mentions_techno(artist) for artist in event.artists)):
                 filtered.append(event)
                 
         return filtered
\ No newline at end of file
@@ -1,16 +1,44 @@
 import re
 from datetime import datetime
 from typing import List, Optional
+import requests
 from models.event import Event
 from scrapers.base_scraper import BaseScraper
-from dateutil import parser as date_parser
+from utils.date_parser import parse_date_fast
+
+
+_ARTICLE_CLASS_RE = re.compile(r'event')
+_DIV_CLASS_RE = re.compile(r'event-item|event-card')
+_NAME_CLASS_RE = re.compile(r'title|name|event-name')
+_DATE_CLASS_RE = re.compile(r'date|when|time')
+_DATE_PATTERNS = [
+    re.compile(r'(\d{1,2}\s+\w+\s+\d{4})'),  # 3 August 2025
+    re.compile(r'(\w+\s+\d{1,2},?\s+\d{4})'), # August 3, 2025
+    re.compile(r'(\d{1,2}[./]\d{1,2}[./]\d{4})'), # 03/08/2025
+    re.compile(r'(\d{1,2}\s+\w{3}\s+\d{4})'),  # 3 Aug 2025
+]
+_LOCATION_CLASS_RE = re.compile(r'location|venue|room')
+# Patterns like "Label presents Artist" or "Night: Artist1, Artist2", in one regex.
+# Each arm is a lookahead from the start of the title, so the arms keep their priority
+# (a "presents" anywhere wins over an earlier colon) and a single match() call suffices.
+_ARTIST_RE = re.compile(
+    r'(?=(?s:.*?)presents?\s+(.+?)(?:\s+\||$))'
+    r'|(?=(?s:.*?)invites?\s+(.+?)(?:\s+\||$))'
+    r'|(?=(?s:.*?):\s*(.+?)(?:\s+\||$))',
+    re.I
+)
+_ARTIST_SPLIT_RE = re.compile(r'\s*[,&]\s*|\s+b2b\s+|\s+x\s+')
+_AGE_RE = re.compile(r'(\d+)\+')
+_EVENT_LINK_SELECTOR = 'a[href*="/event/"], a[href*="/events/"]'
+_LINK_DATE_RE = re.compile(r'(\d{1,2}\s+\w+\s+\d{4}|\w+\s+\d{1,2},?\s+\d{4})')
 
 
 class LofiScraper(BaseScraper):
-    def __init__(self):
+    def __init__(self, session: Optional[requests.Session] = None):
         super().__init__(
             venue_name="Lofi",
-            venue_url="https://lofi.amsterdam"
+            venue_url="https://lofi.amsterdam",
+            session=session
         )
         
     def scrape_events(self) -> List[Event]:
@@ -26,9 +54,9 @@ class LofiScraper(BaseScraper):
             
         # Look for event containers - common patterns
         event_containers = (
-            soup.find_all('article', class_=re.compile(r'event')) or
-            soup.find_all('div', class_=re.compile(r'event-item|event-card')) or
-            soup.find_all('li', class_=re.compile(r'event'))
+            soup.find_all('article', class_=_ARTICLE_CLASS_RE) or
+            soup.find_all('div', class_=_DIV_CLASS_RE) or
+            soup.find_all('li', class_=_ARTICLE_CLASS_RE)
         )
         
         self.logger.info(f"Found {len(event_containers)} potential event containers")
@@ -41,19 +69,19 @@ class LofiScraper(BaseScraper):
                     events.append(event)
         else:
             # Fallback: look for event links
+            # A single CSS query selects candidates; links are resolved first so the
+            # listing page itself is skipped whether its href is relative or absolute
             event_links = []
-            for link in soup.find_all('a', href=True):
-                href = link.get('href')
-                if '/event/' in href or '/events/' in href and href != events_url:
-                    event_links.append(link)
-                    
-            self.logger.info(f"Found {len(event_links)} event links as fallback")
-            
-            for link in event_links[:15]:
-                event_url = link.get('href')
+            for link in soup.select(_EVENT_LINK_SELECTOR):
+                event_url = link['href']
                 if not event_url.startswith('http'):
                     event_url = self.venue_url + event_url
+                if event_url != events_url:
+                    event_links.append((link, event_url))
                     
+            self.logger.info(f"Found {len(event_links)} event links as fallback")
+            
+            for link, event_url in event_links[:15]:
                 # Try to extract basic info from the link
                 event = self._parse_event_link(link, event_url)
                 if event:
@@ -68,6 +96,9 @@ class LofiScraper(BaseScraper):
     def _parse_event_container(self, container) -> Optional[Event]:
         """Parse event information from a container element"""
         try:
+            # Rebuilding .text walks the whole subtree, so do it once
+            container_text = container.text
+            
             # Extract event name
             name_elem = None
             for tag in ['h1', 'h2', 'h3', 'h4', 'h5']:
@@ -76,39 +107,35 @@ class LofiScraper(BaseScraper):
                     break
                     
             if not name_elem:
-                name_elem = container.find(class_=re.compile(r'title|name|event-name'))
+                name_elem = container.find(class_=_NAME_CLASS_RE)
                 
             event_name = name_elem.text.strip() if name_elem else ""
             
             # Extract date - Lofi often uses various formats
+            structured_date = self.extract_structured_date(container)
             date_str = None
-            date_patterns = [
-                r'(\d{1,2}\s+\w+\s+\d{4})',  # 3 August 2025
-                r'(\w+\s+\d{1,2},?\s+\d{4})', # August 3, 2025
-                r'(\d{1,2}[./]\d{1,2}[./]\d{4})', # 03/08/2025
-                r'(\d{1,2}\s+\w{3}\s+\d{4})',  # 3 Aug 2025
-            ]
             
             # Look for date in specific elements first
-            date_elem = container.find(class_=re.compile(r'date|when|time'))
+            date_elem = None if structured_date else container.find(class_=_DATE_CLASS_RE)
             if date_elem:
                 date_str = date_elem.text.strip()
-            else:
+            elif not structured_date:
                 # Search the whole container text
-                for pattern in date_patterns:
-                    match = re.search(pattern, container.text)
+                for pattern in _DATE_PATTERNS:
+                    match = pattern.search(container_text)
                     if match:
                         date_str = match.group(1)
                         break
                         
             # Parse date
-            event_date = datetime.now()
+            now = datetime.now()
+            event_date = structured_date or now
             if date_str:
                 try:
-                    event_date = date_parser.parse(date_str, fuzzy=True)
+                    event_date = parse_date_fast(date_str)
                     # Adjust year if date is in the past
-                    if event_date < datetime.now() and event_date.year == datetime.now().year:
-                        event_date = event_date.replace(year=datetime.now().year + 1)
+                    if event_date < now and event_date.year == now.year:
+                        event_date = event_date.replace(year=now.year + 1)
                 except:
                     self.logger.warning(f"Could not parse date: {date_str}")
                     
@@ -121,27 +148,19 @@ class LofiScraper(BaseScraper):
                     event_url = self.venue_url + event_url
                     
             # Extract venue location (Club, Courtyard, Colorfloor)
-            location_elem = container.find(class_=re.compile(r'location|venue|room'))
+            location_elem = container.find(class_=_LOCATION_CLASS_RE)
             location = location_elem.text.strip() if location_elem else None
             
             # Extract artists - often in the event name or separate elements
             artists = []
             # Common patterns in event names
-            if event_name:
-                # Look for patterns like "Artist1 b2b Artist2" or "Artist1, Artist2"
-                artist_patterns = [
-                    r'presents?\s+(.+?)(?:\s+\||$)',
-                    r'invites?\s+(.+?)(?:\s+\||$)',
-                    r':\s*(.+?)(?:\s+\||$)',
-                ]
-                for pattern in artist_patterns:
-                    match = re.search(pattern, event_name, re.I)
-                    if match:
-                        artist_string = match.group(1)
-                        # Split by common separators
-                        artist_list = re.split(r'\s*[,&]\s*|\s+b2b\s+|\s+x\s+', artist_string)
-                        artists.extend([a.strip() for a in artist_list if a.strip()])
-                        break
+            match = _ARTIST_RE.match(event_name) if event_name else None
+            if match:
+                # Only the matching arm's group is set
+                artist_string = match.group(match.lastindex)
+                # Split by common separators like "Artist1 b2b Artist2" or "Artist1, Artist2"
+                artist_list = _ARTIST_SPLIT_RE.split(artist_string)
+                artists.extend([a.strip() for a in artist_list if a.strip()])
                         
             # Build description
             description_parts = []
@@ -149,7 +168,7 @@ class LofiScraper(BaseScraper):
                 description_parts.append(f"Location: {location}")
             
             # Look for age restriction
-            age_match = re.search(r'(\d+)\+', container.text)
+            age_match = _AGE_RE.search(container_text)
             if age_match:
                 description_parts.append(f"Age: {age_match.group(0)}")
                 
@@ -181,13 +200,10 @@ class LofiScraper(BaseScraper):
             event_date = datetime.now()
             parent = link.find_parent()
             if parent:
-                date_match = re.search(
-                    r'(\d{1,2}\s+\w+\s+\d{4}|\w+\s+\d{1,2},?\s+\d{4})',
-                    parent.text
-                )
+                date_match = _LINK_DATE_RE.search(parent.text)
                 if date_match:
                     try:
-                        event_date = date_parser.parse(date_match.group(1), fuzzy=True)
+                        event_date = parse_date_fast(date_match.group(1))
                     except:
                         pass
                         
@@ -1,16 +1,29 @@
 import re
 from datetime import datetime
 from typing import List, Optional
+import requests
 from models.event import Event
 from scrapers.base_scraper import BaseScraper
-from dateutil import parser as date_parser
+from utils.date_parser import parse_date_fast
+
+
+_ARTICLE_CLASS_RE = re.compile(r'event|card')
+_DIV_CLASS_RE = re.compile(r'event|card|item')
+_EVENT_LINK_RE = re.compile(r'/event/|/program/')
+_NAME_CLASS_RE = re.compile(r'title|name|heading')
+_DATE_CLASS_RE = re.compile(r'date|when|time')
+_DATE_TEXT_RE = re.compile(r'\d{1,2}[\s\-/]\w+')
+_DATE_RE = re.compile(r'(\d{1,2}\s+\w+\s+\d{4}|\w+\s+\d{1,2},?\s+\d{4}|\d{1,2}[./]\d{1,2}[./]\d{2,4})')
+_CATEGORY_CLASS_RE = re.compile(r'category|type|tag')
+_LINEUP_RE = re.compile(r'line[\s-]?up', re.I)
 
 
 class RadionScraper(BaseScraper):
-    def __init__(self):
+    def __init__(self, session: Optional[requests.Session] = None):
         super().__init__(
             venue_name="Radion",
-            venue_url="https://radion.amsterdam"
+            venue_url="https://radion.amsterdam",
+            session=session
         )
         
     def scrape_events(self) -> List[Event]:
@@ -27,9 +40,9 @@ class RadionScraper(BaseScraper):
         # Look for event cards or listings
         # Common patterns for event containers
         event_containers = (
-            soup.find_all('article', class_=re.compile(r'event|card')) or
-            soup.find_all('div', class_=re.compile(r'event|card|item')) or
-            soup.find_all('a', class_=re.compile(r'event|card'))
+            soup.find_all('article', class_=_ARTICLE_CLASS_RE) or
+            soup.find_all('div', class_=_DIV_CLASS_RE) or
+            soup.find_all('a', class_=_ARTICLE_CLASS_RE)
         )
         
         self.logger.info(f"Found {len(event_containers)} potential event containers")
@@ -46,17 +59,17 @@ class RadionScraper(BaseScraper):
             return techno_events
             
         # Alternative: look for event links
-        event_links = soup.find_all('a', href=re.compile(r'/event/|/program/'))
+        event_links = soup.find_all('a', href=_EVENT_LINK_RE)
         self.logger.info(f"Found {len(event_links)} event links as fallback")
         
+        event_urls = []
         for link in event_links[:10]:
             event_url = link.get('href')
             if not event_url.startswith('http'):
                 event_url = self.venue_url + event_url
-                
-            event = self._scrape_event_detail(event_url)
-            if event:
-                events.append(event)
+            event_urls.append(event_url)
+            
+        events.extend(self.scrape_concurrently(self._scrape_event_detail, event_urls))
                 
         techno_events = self.filter_techno_events(events)
         self.logger.info(f"Found {len(techno_events)} techno events")
@@ -68,7 +81,7 @@ class RadionScraper(BaseScraper):
             # Extract event name
             name_elem = (
                 container.find(['h2', 'h3', 'h4']) or
-                container.find(class_=re.compile(r'title|name|heading'))
+                container.find(class_=_NAME_CLASS_RE)
             )
             event_name = name_elem.text.strip() if name_elem else None
             
@@ -76,32 +89,31 @@ class RadionScraper(BaseScraper):
                 # Try to get text from the container itself
                 event_name = container.text.strip()[:100]
                 
-            # Extract date
+            # Extract date, preferring machine-readable markup
+            structured_date = self.extract_structured_date(container)
             date_str = None
-            date_elem = (
-                container.find(class_=re.compile(r'date|when|time')) or
-                container.find(text=re.compile(r'\d{1,2}[\s\-/]\w+'))
+            date_elem = None if structured_date else (
+                container.find(class_=_DATE_CLASS_RE) or
+                container.find(text=_DATE_TEXT_RE)
             )
             
             if date_elem:
                 date_str = date_elem.text if hasattr(date_elem, 'text') else str(date_elem)
-            else:
+            elif not structured_date:
                 # Look for date patterns in the container text
-                date_match = re.search(
-                    r'(\d{1,2}\s+\w+\s+\d{4}|\w+\s+\d{1,2},?\s+\d{4}|\d{1,2}[./]\d{1,2}[./]\d{2,4})',
-                    container.text
-                )
+                date_match = _DATE_RE.search(container.text)
                 if date_match:
                     date_str = date_match.group(1)
                     
             # Parse date
-            event_date = datetime.now()  # Default
+            now = datetime.now()
+            event_date = structured_date or now  # Default
             if date_str:
                 try:
-                    event_date = date_parser.parse(date_str, fuzzy=True)
+                    event_date = parse_date_fast(date_str)
                     # If parsed date is in the past and doesn't have year, assume next year
-                    if event_date < datetime.now() and event_date.year == datetime.now().year:
-                        event_date = event_date.replace(year=datetime.now().year + 1)
+                    if event_date < now and event_date.year == now.year:
+                        event_date = event_date.replace(year=now.year + 1)
                 except:
                     pass
                     
@@ -112,7 +124,7 @@ class RadionScraper(BaseScraper):
                 event_url = self.venue_url + event_url
                 
             # Extract category/type
-            category_elem = container.find(class_=re.compile(r'category|type|tag'))
+            category_elem = container.find(class_=_CATEGORY_CLASS_RE)
             description = category_elem.text.strip() if category_elem else None
             
             return Event(
@@ -139,19 +151,20 @@ class RadionScraper(BaseScraper):
             title_elem = soup.find('h1') or soup.find('title')
             event_name = title_elem.text.strip() if title_elem else "Unknown Event"
             
-            # Extract date
-            date_elem = soup.find(class_=re.compile(r'date|when|time'))
-            event_date = datetime.now()
+            # Extract date, preferring machine-readable markup
+            event_date = self.extract_structured_date(soup)
+            date_elem = None if event_date else soup.find(class_=_DATE_CLASS_RE)
+            event_date = event_date or datetime.now()
             
             if date_elem:
                 try:
-                    event_date = date_parser.parse(date_elem.text.strip(), fuzzy=True)
+                    event_date = parse_date_fast(date_elem.text.strip())
                 except:
                     pass
                     
             # Extract artists from lineup
             artists = []
-            lineup_container = soup.find(text=re.compile(r'line[\s-]?up', re.I))
+            lineup_container = soup.find(text=_LINEUP_RE)
             if lineup_container:
                 parent = lineup_container.find_parent()
                 if parent:
@@ -1,16 +1,28 @@
 import re
 from datetime import datetime
 from typing import List, Optional
+import requests
 from models.event import Event
 from scrapers.base_scraper import BaseScraper
-from dateutil import parser as date_parser
+from utils.date_parser import parse_date_fast
+
+
+_EVENT_LINK_RE = re.compile(r'/event/[^/]+/?$')
+# One alternation so the page text is scanned once
+_DATE_RE = re.compile(
+    r'(\d{1,2}[./]\d{1,2}[./]\d{2,4}'  # 02.08.2024 or 02/08/2024
+    r'|\w+\s+\d{1,2}\s*,?\s*\d{4}'     # August 2, 2024
+    r'|\d{1,2}\s+\w+\s+\d{4})'          # 2 August 2024
+)
+_LINEUP_RE = re.compile(r'line[\s-]?up', re.I)
 
 
 class ShelterScraper(BaseScraper):
-    def __init__(self):
+    def __init__(self, session: Optional[requests.Session] = None):
         super().__init__(
             venue_name="Shelter",
-            venue_url="https://www.shelteramsterdam.nl"
+            venue_url="https://www.shelteramsterdam.nl",
+            session=session
         )
         
     def scrape_events(self) -> List[Event]:
@@ -23,18 +35,18 @@ class ShelterScraper(BaseScraper):
             return events
             
         # Find all event links
-        event_links = soup.find_all('a', href=re.compile(r'/event/[^/]+/?$'))
+        event_links = soup.find_all('a', href=_EVENT_LINK_RE)
         self.logger.info(f"Found {len(event_links)} potential event links")
         
         # Process each event link
+        event_urls = []
         for link in event_links[:10]:  # Limit to prevent overwhelming the server
             event_url = link.get('href')
             if not event_url.startswith('http'):
                 event_url = self.venue_url + event_url.rstrip('/')
-                
-            event = self._scrape_event_detail(event_url)
-            if event:
-                events.append(event)
+            event_urls.append(event_url)
+            
+        events.extend(self.scrape_concurrently(self._scrape_event_detail, event_urls))
                 
         # Filter for techno events
         techno_events = self.filter_techno_events(events)
@@ -53,33 +65,20 @@ class ShelterScraper(BaseScraper):
             title_elem = soup.find('h1') or soup.find('title')
             event_name = title_elem.text.strip() if title_elem else "Unknown Event"
             
-            # Try to find date information
-            date_str = None
-            date_patterns = [
-                r'(\d{1,2}[./]\d{1,2}[./]\d{2,4})',  # 02.08.2024 or 02/08/2024
-                r'(\w+\s+\d{1,2}\s*,?\s*\d{4})',      # August 2, 2024
-                r'(\d{1,2}\s+\w+\s+\d{4})',           # 2 August 2024
-            ]
+            # Prefer machine-readable markup over scanning the whole page text
+            event_date = self.extract_structured_date(soup)
             
-            # Search for date in common locations
-            for pattern in date_patterns:
-                date_match = re.search(pattern, soup.text)
-                if date_match:
-                    date_str = date_match.group(1)
-                    break
-                    
-            # Parse the date
-            if date_str:
+            if not event_date:
+                # Search for date in common locations
+                date_match = _DATE_RE.search(soup.text)
                 try:
-                    event_date = date_parser.parse(date_str, fuzzy=True)
+                    event_date = parse_date_fast(date_match.group(1)) if date_match else datetime.now()
                 except:
                     event_date = datetime.now()  # Default to now if parsing fails
-            else:
-                event_date = datetime.now()
                 
             # Extract artists - look for lineup or artist mentions
             artists = []
-            lineup_section = soup.find(text=re.compile(r'line[\s-]?up', re.I))
+            lineup_section = soup.find(text=_LINEUP_RE)
             if lineup_section:
                 lineup_container = lineup_section.find_parent()
                 if lineup_container:
@@ -90,6 +89,8 @@ class ShelterScraper(BaseScraper):
                         if text and len(text) < 50:  # Reasonable artist name length
                             artists.append(text)
                             
+            description_elem = soup.find('meta', {'name': 'description'})
+            
             # Create event object
             return Event(
                 venue=self.venue_name,
@@ -98,7 +99,7 @@ class ShelterScraper(BaseScraper):
                 date=event_date,
                 url=event_url,
                 artists=artists[:10],  # Limit to prevent too many false positives
-                description=soup.find('meta', {'name': 'description'})['content'] if soup.find('meta', {'name': 'description'}) else None
+                description=description_elem['content'] if description_elem else None
             )
             
         except Exception as e:
@@ -1,10 +1,12 @@
+import time
+import threading
 import pytest
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import Mock, patch, MagicMock, call
 from datetime import datetime
 import responses
 import requests
 
-from scrapers.base_scraper import BaseScraper
+from scrapers.base_scraper import BaseScraper, create_session
 from models.event import Event
 
 
@@ -16,7 +18,8 @@ class TestBaseScraper:
             def scrape_events(self):
                 return []
                 
-        return MockScraper("Test Venue", "https://test.com")
+        # A session of its own, so throttle timestamps don't carry over from earlier tests
+        return MockScraper("Test Venue", "https://test.com", session=create_session())
         
     def test_initialization(self, mock_scraper):
         """Test scraper initialization"""
@@ -25,6 +28,15 @@ class TestBaseScraper:
         assert isinstance(mock_scraper.session, requests.Session)
         assert "User-Agent" in mock_scraper.session.headers
         
+    def test_scrapers_share_pooled_session(self, mock_scraper):
+        """Test that scrapers reuse one session with a sized connection pool"""
+        scraper = type(mock_scraper)("Test Venue", "https://test.com")
+        other = type(mock_scraper)("Other Venue", "https://other.com")
+        
+        assert other.session is scraper.session
+        pool_kw = scraper.session.get_adapter("https://test.com").poolmanager.connection_pool_kw
+        assert pool_kw["maxsize"] == 32
+        
     @responses.activate
     def test_fetch_page_success(self, mock_scraper):
         """Test successful page fetching"""
@@ -42,6 +54,21 @@ class TestBaseScraper:
         assert soup.find("h1").text == "Test Page"
         assert len(responses.calls) == 1
         
+    @responses.activate
+    def test_fetch_page_uses_declared_charset(self, mock_scraper):
+        """Test that the Content-Type charset is used to decode the page"""
+        responses.add(
+            responses.GET,
+            "https://test.com/latin",
+            body="<html><body><h1>Caf\u00e9</h1></body></html>".encode("iso-8859-1"),
+            content_type="text/html; charset=iso-8859-1",
+            status=200
+        )
+        
+        soup = mock_scraper.fetch_page("https://test.com/latin")
+        
+        assert soup.find("h1").text == "Caf\u00e9"
+        
     @responses.activate
     def test_fetch_page_retry_on_failure(self, mock_scraper):
         """Test retry logic on failed requests"""
@@ -86,6 +113,100 @@ class TestBaseScraper:
         assert soup is None
         assert len(responses.calls) == 3
         
+    @responses.activate
+    def test_fetch_page_no_retry_on_client_error(self, mock_scraper):
+        """Test that 4xx responses other than 408/429 are not retried"""
+        responses.add(responses.GET, "https://client-error.test/missing", status=404)
+        responses.add(responses.GET, "https://client-error.test/busy", status=429)
+        responses.add(responses.GET, "https://client-error.test/busy", body="<html></html>", status=200)
+        
+        with patch('time.sleep') as mock_sleep, patch('random.uniform', return_value=0.25):
+            assert mock_scraper.fetch_page("https://client-error.test/missing") is None
+            assert len(responses.calls) == 1
+            mock_sleep.assert_not_called()
+            
+            assert mock_scraper.fetch_page("https://client-error.test/busy") is not None
+            assert len(responses.calls) == 3
+            # Backoff starts at 1s, scaled by the jitter factor
+            assert call(1.25) in mock_sleep.call_args_list
+            
+    @responses.activate
+    def test_fetch_page_throttles_same_host(self, mock_scraper):
+        """Test that only repeated requests to the same host are delayed"""
+        for url in ["https://throttle.test/a", "https://throttle.test/b", "https://other.test/a"]:
+            responses.add(responses.GET, url, body="<html></html>", status=200)
+            
+        with patch('time.sleep') as mock_sleep:
+            mock_scraper.fetch_page("https://throttle.test/a")
+            mock_sleep.assert_not_called()
+            
+            mock_scraper.fetch_page("https://other.test/a")
+            mock_sleep.assert_not_called()
+            
+            mock_scraper.fetch_page("https://throttle.test/b")
+            mock_sleep.assert_called_once()
+            adapter = mock_scraper.session.get_adapter("https://throttle.test")
+            assert 0 < mock_sleep.call_args.args[0] <= adapter.min_interval
+        
+    @responses.activate
+    def test_fetch_page_cache_hit_skips_throttle(self, tmp_path, monkeypatch):
+        """Test that cached responses are served without waiting on the host throttle"""
+        class MockScraper(BaseScraper):
+            def scrape_events(self):
+                return []
+                
+        monkeypatch.chdir(tmp_path)  # Keep the SQLite cache file out of the repo
+        session = create_session(cache_ttl=60)
+        scraper = MockScraper("Test Venue", "https://test.com", session=session)
+        responses.add(responses.GET, "https://cached.test/page", body="<html><h1>Hi</h1></html>", status=200)
+        
+        with patch('time.sleep') as mock_sleep:
+            first = scraper.fetch_page("https://cached.test/page")
+            second = scraper.fetch_page("https://cached.test/page")
+            
+        assert first.find("h1").text == second.find("h1").text == "Hi"
+        assert len(responses.calls) == 1
+        mock_sleep.assert_not_called()
+        
+    def test_scrape_concurrently(self, mock_scraper):
+        """Test concurrent detail scraping keeps URL order and drops failures"""
+        def scrape_detail(url):
+            if url.endswith("broken"):
+                return None
+            return Event(venue="Test", venue_url="https://test.com",
+                         name=url.rsplit("/", 1)[-1], date=datetime.now())
+                         
+        urls = [f"https://test.com/event/{i}" for i in range(5)] + ["https://test.com/event/broken"]
+        events = mock_scraper.scrape_concurrently(scrape_detail, urls)
+        
+        assert [e.name for e in events] == ["0", "1", "2", "3", "4"]
+        assert mock_scraper.scrape_concurrently(scrape_detail, []) == []
+        
+    def test_fetch_page_respects_concurrency(self, mock_scraper):
+        """Test that fetch_page never has more than max_concurrency requests in flight"""
+        in_flight = []
+        peak = []
+        lock = threading.Lock()
+        
+        def slow_get(url, timeout):
+            with lock:
+                in_flight.append(url)
+                peak.append(len(in_flight))
+            time.sleep(0.05)
+            with lock:
+                in_flight.remove(url)
+            return Mock(content=b"<html></html>", headers={}, raise_for_status=Mock())
+            
+        session = Mock(get=Mock(side_effect=slow_get))
+        scraper = type(mock_scraper)("Test Venue", "https://test.com", session=session, max_concurrency=2)
+        urls = [f"https://test.com/event/{i}" for i in range(6)]
+        
+        scraper.scrape_concurrently(scraper.fetch_page, urls)
+        
+        assert session.get.call_count == 6
+        assert session.get.call_args.kwargs["timeout"] == (5, 30)
+        assert max(peak) == 2
+        
     def test_filter_techno_events_by_name(self, mock_scraper):
         """Test filtering events by techno keywords in name"""
         events = [
@@ -211,4 +332,31 @@ class TestBaseScraper:
         filtered = mock_scraper.filter_techno_events(events)
         
         assert len(filtered) == 2
-        assert all("jazz" not in event.name.lower() for event in filtered)
\ No newline at end of file
+        assert all("jazz" not in event.name.lower() for event in filtered)
+        
+    def test_filter_techno_events_whole_words(self, mock_scraper):
+        """Test that keywords only match whole words, including hyphenated parts"""
+        events = [
+            Event(
+                venue="Test",
+                venue_url="https://test.com",
+                name="Technology Meetup",
+                date=datetime.now()
+            ),
+            Event(
+                venue="Test",
+                venue_url="https://test.com",
+                name="Tech-House Friday",
+                date=datetime.now()
+            ),
+            Event(
+                venue="Test",
+                venue_url="https://test.com",
+                name="Acid-Techno Marathon",
+                date=datetime.now()
+            )
+        ]
+        
+        filtered = mock_scraper.filter_techno_events(events)
+        
+        assert [event.name for event in filtered] == ["Tech-House Friday", "Acid-Techno Marathon"]
\ No newline at end of file
@@ -1,6 +1,6 @@
 import pytest
 from datetime import datetime, timedelta
-from utils.date_parser import parse_dutch_date, parse_event_date, extract_time_info
+from utils.date_parser import parse_dutch_date, parse_event_date, extract_time_info, parse_date_fast, _parse_absolute_date
 
 
 class TestDutchDateParser:
@@ -39,6 +39,24 @@ class TestDutchDateParser:
         assert date1 is not None
         assert date2 is not None
         assert date1.date() == date2.date()
+        
+    def test_parse_dutch_names_at_word_start(self):
+        """Test that names are translated at the start of words, not inside them"""
+        assert parse_dutch_date("vrijdagavond 15maart 2024").date() == datetime(2024, 3, 15).date()
+        assert parse_dutch_date("kermeis 3 mei 2024").date() == datetime(2024, 5, 3).date()
+        
+    def test_parse_dutch_date_is_cached(self):
+        """Test that repeated date strings are served from the cache"""
+        first = parse_dutch_date("zaterdag 22 juni 2024")
+        hits = _parse_absolute_date.cache_info().hits
+        
+        assert parse_dutch_date("zaterdag 22 juni 2024") == first
+        assert _parse_absolute_date.cache_info().hits == hits + 1
+        
+    def test_parse_dutch_date_without_year_follows_reference(self):
+        """Test that a cached date without a year is resolved against each reference day"""
+        assert parse_dutch_date("22 juni", datetime(2024, 1, 1)) == datetime(2024, 6, 22)
+        assert parse_dutch_date("22 juni", datetime(2025, 1, 1)) == datetime(2025, 6, 22)
 
 
 class TestEventDateParser:
@@ -89,6 +107,10 @@ class TestEventDateParser:
         result = parse_event_date("morgen", reference)  # Dutch
         assert result.date() == (reference + timedelta(days=1)).date()
         
+        # Day after tomorrow
+        result = parse_event_date("overmorgen", reference)  # Dutch
+        assert result.date() == (reference + timedelta(days=2)).date()
+        
     def test_parse_weekend_relative(self):
         """Test parsing 'this weekend' relative to different days"""
         # Monday - should return Friday
@@ -109,6 +131,75 @@ class TestEventDateParser:
         
         result = parse_event_date("gibberish date", reference)
         assert result == reference
+        
+    def test_parse_numeric_dates_day_first(self):
+        """Test that numeric dates are read day-first, as Dutch venues write them"""
+        reference = datetime(2024, 1, 1)
+        
+        assert parse_event_date("02.08.2024", reference) == datetime(2024, 8, 2)
+        assert parse_event_date("Saturday 15.03.2024", reference) == datetime(2024, 3, 15)
+        
+    def test_parse_dutch_month_in_event_date(self):
+        """Test that a Dutch month is read as the month, not skipped by fuzzy parsing"""
+        reference = datetime(2025, 1, 1)
+        
+        assert parse_event_date("vrijdag 3 mei 2025", reference) == datetime(2025, 5, 3)
+        
+    def test_parse_bare_numeric_dates(self):
+        """Test the numeric fast path for each separator, short years and ISO dates"""
+        reference = datetime(2024, 1, 1)
+        
+        assert parse_event_date("03/04/2024", reference) == datetime(2024, 4, 3)
+        assert parse_event_date("03-04-2024", reference) == datetime(2024, 4, 3)
+        assert parse_event_date("03.04.24", reference) == datetime(2024, 4, 3)
+        assert parse_event_date("2024-4-3", reference) == datetime(2024, 4, 3)
+        # Impossible dates aren't built, so parsing falls back to the reference date
+        assert parse_event_date("31.02.2024", reference) == reference
+        
+    def test_cached_parse_respects_reference_date(self):
+        """Test that repeated date strings hit the cache only for the same reference day"""
+        first = parse_event_date("1 January 12:00", datetime(2000, 6, 1, 9))
+        hits = _parse_absolute_date.cache_info().hits
+        
+        assert parse_event_date("1 January 12:00", datetime(2000, 6, 1, 18)) == first
+        assert _parse_absolute_date.cache_info().hits == hits + 1
+        
+        second = parse_event_date("1 January 12:00", datetime(2100, 6, 1))
+        assert first == datetime(2001, 1, 1, 12)
+        assert second == datetime(2101, 1, 1, 12)
+        
+    def test_cached_weekday_follows_reference_date(self):
+        """Test that a cached weekday-only date isn't reused once the day moves on"""
+        # 2026-10-15 is a Thursday, so "vrijdag" is the next day
+        first = parse_event_date("vrijdag 23:00", datetime(2026, 10, 15, 12))
+        later = parse_event_date("vrijdag 23:00", datetime(2026, 10, 20, 12))
+        
+        assert first == datetime(2026, 10, 16, 23)
+        assert later == datetime(2026, 10, 23, 23)
+
+
+class TestFastDateParser:
+    def test_parse_common_formats(self):
+        """Test the exact formats venues commonly use"""
+        test_cases = [
+            ("3 August 2025", datetime(2025, 8, 3)),
+            ("August 3, 2025", datetime(2025, 8, 3)),
+            ("03/08/2025", datetime(2025, 8, 3)),  # Day first
+            ("03.08.2025", datetime(2025, 8, 3)),
+            ("3 Aug 2025", datetime(2025, 8, 3)),
+            ("  3 august 2025 ", datetime(2025, 8, 3))
+        ]
+        
+        for date_str, expected in test_cases:
+            assert parse_date_fast(date_str) == expected
+            
+    def test_fallback_to_fuzzy_parsing(self):
+        """Test that other shapes still go through dateutil"""
+        result = parse_date_fast("Saturday 15 March 2024 23:00")
+        assert result == datetime(2024, 3, 15, 23, 0)
+        
+        with pytest.raises(ValueError):
+            parse_date_fast("no date here")
 
 
 class TestTimeExtraction:
@@ -155,4 +246,11 @@ class TestTimeExtraction:
         text = "Van 23:00 uur - 06:00 uur"
         result = extract_time_info(text)
         
-        assert result == {"start_time": "23:00", "end_time": "06:00"}
\ No newline at end of file
+        assert result == {"start_time": "23:00", "end_time": "06:00"}
+        
+    def test_first_time_range_wins(self):
+        """Test that the earliest range in the text is used, whatever its format"""
+        text = "Doors 10pm - 4am, season 2024-2025"
+        result = extract_time_info(text)
+        
+        assert result == {"start_time": "22:00", "end_time": "04:00"}
\ No newline at end of file
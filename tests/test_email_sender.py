@@ -5,8 +5,9 @@ import json
 import os
 
 from utils.email_sender import (
-    format_events_html, format_events_text, send_email, save_events_json
+    format_events_html, format_events_text, send_email, save_events_json, close_smtp
 )
+from utils import email_sender
 from models.event import Event
 
 
@@ -124,12 +125,17 @@ class TestEmailFormatting:
 
 
 class TestEmailSending:
+    @pytest.fixture(autouse=True)
+    def reset_smtp_connection(self):
+        """Don't let a cached connection leak between tests"""
+        yield
+        close_smtp()
+        
     @patch('smtplib.SMTP')
     def test_send_email_success(self, mock_smtp):
         """Test successful email sending"""
         # Setup mock SMTP
-        mock_server = MagicMock()
-        mock_smtp.return_value.__enter__.return_value = mock_server
+        mock_server = mock_smtp.return_value
         
         events = [
             Event(
@@ -154,14 +160,63 @@ class TestEmailSending:
         mock_smtp.assert_called_once_with('smtp.test.com', 587)
         mock_server.starttls.assert_called_once()
         mock_server.login.assert_called_once_with('test@test.com', 'testpass')
-        mock_server.send_message.assert_called_once()
+        mock_server.sendmail.assert_called_once()
+        from_addr, to_addrs, payload = mock_server.sendmail.call_args.args
+        assert from_addr == 'from@test.com'
+        assert to_addrs == ['recipient@test.com']
+        assert isinstance(payload, bytes)
+        
+    @patch('smtplib.SMTP')
+    def test_send_email_multiple_recipients(self, mock_smtp):
+        """Test that a list of recipients is served by one serialized message"""
+        mock_server = mock_smtp.return_value
+        
+        events = [Event(venue="Test", venue_url="https://test.com",
+                       name="Test", date=datetime.now())]
+        smtp_config = {
+            'server': 'smtp.test.com',
+            'port': 587,
+            'username': 'test@test.com',
+            'password': 'testpass'
+        }
+        
+        result = send_email(events, ['one@test.com', 'two@test.com'], smtp_config)
+        
+        assert result is True
+        mock_server.sendmail.assert_called_once()
+        from_addr, to_addrs, payload = mock_server.sendmail.call_args.args
+        assert from_addr == 'test@test.com'
+        assert to_addrs == ['one@test.com', 'two@test.com']
+        assert b'To: one@test.com, two@test.com' in payload
+        
+    @patch('smtplib.SMTP')
+    def test_send_email_reuses_connection(self, mock_smtp):
+        """Test that a live SMTP connection is reused across sends"""
+        mock_server = mock_smtp.return_value
+        mock_server.noop.return_value = (250, b'OK')
+        
+        events = [Event(venue="Test", venue_url="https://test.com",
+                       name="Test", date=datetime.now())]
+        smtp_config = {
+            'server': 'smtp.test.com',
+            'port': 587,
+            'username': 'test@test.com',
+            'password': 'testpass'
+        }
+        
+        assert send_email(events, 'one@test.com', smtp_config) is True
+        assert send_email(events, 'two@test.com', smtp_config) is True
+        
+        mock_smtp.assert_called_once_with('smtp.test.com', 587)
+        mock_server.login.assert_called_once()
+        assert mock_server.sendmail.call_count == 2
+        
+        close_smtp()
+        mock_server.quit.assert_called_once()
         
     @patch('smtplib.SMTP')
     def test_send_email_from_env_vars(self, mock_smtp):
         """Test email sending using environment variables"""
-        mock_server = MagicMock()
-        mock_smtp.return_value.__enter__.return_value = mock_server
-        
         events = [Event(venue="Test", venue_url="https://test.com", 
                        name="Test", date=datetime.now())]
         
@@ -224,11 +279,12 @@ class TestEventSaving:
             save_events_json(events, "test.json")
             
         # Check file was opened for writing
-        m.assert_called_once_with("test.json", 'w', encoding='utf-8')
+        m.assert_called_once_with("test.json", 'wb')
         
-        # Get what was written
+        # The whole document should be written in one call
         handle = m()
-        written_content = ''.join(call.args[0] for call in handle.write.call_args_list)
+        handle.write.assert_called_once()
+        written_content = handle.write.call_args.args[0]
         
         # Parse and verify JSON
         data = json.loads(written_content)
@@ -236,6 +292,7 @@ class TestEventSaving:
         assert data[0]['venue'] == "Test Venue"
         assert data[0]['name'] == "Test Event"
         assert data[0]['artists'] == ["Artist 1"]
+        assert data[0]['date'] == "2024-03-15T23:00:00"
         
     def test_save_events_json_with_special_chars(self):
         """Test saving events with special characters"""
@@ -253,10 +310,35 @@ class TestEventSaving:
         with patch('builtins.open', m):
             save_events_json(events, "test.json")
             
-        written_content = ''.join(call.args[0] for call in m().write.call_args_list)
+        m().write.assert_called_once()
+        written_content = m().write.call_args.args[0]
         data = json.loads(written_content)
         
         # Special characters should be preserved
         assert "Café" in data[0]['venue']
         assert "×" in data[0]['name']
-        assert "'" in data[0]['description']
\ No newline at end of file
+        assert "'" in data[0]['description']
+        
+    def test_save_events_json_without_orjson(self):
+        """Test that the stdlib encoder produces the same document when orjson is missing"""
+        events = [
+            Event(
+                venue="Café Test",
+                venue_url="https://test.com",
+                name="Techno Night × Special Guest",
+                date=datetime(2024, 3, 15, 23, 0),
+                artists=["Artist 1"]
+            )
+        ]
+        
+        outputs = []
+        for orjson_module in (None, email_sender.orjson):
+            m = mock_open()
+            with patch('builtins.open', m), patch.object(email_sender, 'orjson', orjson_module):
+                save_events_json(events, "test.json")
+            m().write.assert_called_once()
+            outputs.append(m().write.call_args.args[0])
+            
+        assert json.loads(outputs[0]) == json.loads(outputs[1])
+        # Non-ASCII characters are written as UTF-8, not \u escapes
+        assert "Café".encode('utf-8') in outputs[0]
\ No newline at end of file
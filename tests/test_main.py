@@ -3,6 +3,8 @@ from unittest.mock import patch, MagicMock, call
 from datetime import datetime, timedelta
 import sys
 import os
+import time
+import subprocess
 
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -12,8 +14,9 @@ from models.event import Event
 
 
 class TestTechnoEventAggregator:
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def aggregator(self):
+        # Shared by the class; tests patch scraper methods on the classes, never this instance
         return TechnoEventAggregator()
         
     def test_initialization(self, aggregator):
@@ -55,7 +58,8 @@ class TestTechnoEventAggregator:
         mock_lofi.assert_called_once()
         
     @patch('main.ShelterScraper.scrape_events')
-    def test_scrape_all_venues_with_error(self, mock_shelter, aggregator):
+    @patch('main.LofiScraper.scrape_events', return_value=[])
+    def test_scrape_all_venues_with_error(self, mock_lofi, mock_shelter, aggregator):
         """Test scraping continues even if one venue fails"""
         # Make Shelter scraper fail
         mock_shelter.side_effect = Exception("Network error")
@@ -73,6 +77,47 @@ class TestTechnoEventAggregator:
         assert len(events) >= 1
         assert any(e.venue == "Radion" for e in events)
         
+    @pytest.mark.slow
+    @patch('main.ShelterScraper.scrape_events')
+    @patch('main.RadionScraper.scrape_events')
+    @patch('main.LofiScraper.scrape_events')
+    def test_scrape_all_venues_with_timeout(self, mock_lofi, mock_radion, mock_shelter, aggregator):
+        """Test that a hung venue is skipped once the venue timeout expires"""
+        mock_shelter.side_effect = lambda: time.sleep(1) or []
+        mock_radion.return_value = [
+            Event(venue="Radion", venue_url="https://radion.nl",
+                  name="Event", date=datetime.now())
+        ]
+        mock_lofi.return_value = []
+        
+        start = time.monotonic()
+        with patch.object(aggregator, 'venue_timeout', 0.2):
+            events = aggregator.scrape_all_venues()
+        
+        assert time.monotonic() - start < 1
+        assert [e.venue for e in events] == ["Radion"]
+        
+    @pytest.mark.slow
+    def test_hung_venue_does_not_delay_exit(self):
+        """Test that the process can exit while a timed-out venue is still hanging"""
+        script = (
+            "import time\n"
+            "from unittest.mock import patch\n"
+            "from main import TechnoEventAggregator\n"
+            "with patch('main.ShelterScraper.scrape_events', side_effect=lambda: time.sleep(30)), \\\n"
+            "        patch('main.RadionScraper.scrape_events', return_value=[]), \\\n"
+            "        patch('main.LofiScraper.scrape_events', return_value=[]):\n"
+            "    aggregator = TechnoEventAggregator()\n"
+            "    aggregator.venue_timeout = 0.2\n"
+            "    aggregator.scrape_all_venues()\n"
+        )
+        
+        start = time.monotonic()
+        subprocess.run([sys.executable, "-c", script], check=True, timeout=20,
+                       cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        
+        assert time.monotonic() - start < 10
+        
     def test_filter_upcoming_events(self, aggregator):
         """Test filtering events to upcoming ones only"""
         now = datetime.now()
@@ -119,122 +164,60 @@ class TestTechnoEventAggregator:
 
 
 class TestMainFunction:
-    @patch('sys.argv', ['main.py', '--output', 'json'])
-    @patch('main.TechnoEventAggregator')
-    @patch('main.save_events_json')
-    def test_main_json_output(self, mock_save_json, mock_aggregator_class):
-        """Test main function with JSON output"""
-        # Setup mock aggregator
-        mock_aggregator = MagicMock()
-        mock_aggregator_class.return_value = mock_aggregator
-        
-        # Mock events
-        events = [
-            Event(venue="Test", venue_url="https://test.com",
-                  name="Event 1", date=datetime.now() + timedelta(days=1))
-        ]
-        mock_aggregator.scrape_all_venues.return_value = events
-        mock_aggregator.deduplicate_events.return_value = events
-        mock_aggregator.filter_upcoming_events.return_value = events
-        
-        with pytest.raises(SystemExit) as exc_info:
-            main()
-            
-        assert exc_info.value.code == 0  # Should exit successfully
-        mock_save_json.assert_called_once_with(events, 'events.json')
-        
-    @patch('sys.argv', ['main.py', '--output', 'email', '--email', 'test@test.com'])
-    @patch('main.TechnoEventAggregator')
-    @patch('main.send_email')
-    def test_main_email_output(self, mock_send_email, mock_aggregator_class):
-        """Test main function with email output"""
-        # Setup mock
-        mock_aggregator = MagicMock()
-        mock_aggregator_class.return_value = mock_aggregator
-        
-        events = [
-            Event(venue="Test", venue_url="https://test.com",
-                  name="Event", date=datetime.now() + timedelta(days=1))
-        ]
-        mock_aggregator.scrape_all_venues.return_value = events
-        mock_aggregator.deduplicate_events.return_value = events
-        mock_aggregator.filter_upcoming_events.return_value = events
-        
-        mock_send_email.return_value = True
+    @pytest.fixture(scope="class")
+    def base_aggregator(self):
+        # Built once; copy.copy would share child mocks between tests, so it is reset instead
+        return MagicMock()
         
-        with pytest.raises(SystemExit) as exc_info:
-            main()
+    @pytest.fixture
+    def mock_aggregator(self, base_aggregator):
+        """Patch main's aggregator with the shared mock, cleared of earlier calls and results"""
+        base_aggregator.reset_mock()
+        base_aggregator.scrape_all_venues.return_value = []
+        base_aggregator.deduplicate_events.return_value = []
+        base_aggregator.filter_upcoming_events.return_value = []
+        with patch('main.TechnoEventAggregator', return_value=base_aggregator):
+            yield base_aggregator
             
-        assert exc_info.value.code == 0
-        mock_send_email.assert_called_once_with(events, 'test@test.com')
-        
-    @patch('sys.argv', ['main.py', '--days', '14'])
-    @patch('main.TechnoEventAggregator')
-    @patch('main.save_events_json')
-    def test_main_custom_days(self, mock_save_json, mock_aggregator_class):
-        """Test main function with custom days parameter"""
-        mock_aggregator = MagicMock()
-        mock_aggregator_class.return_value = mock_aggregator
-        
+    @pytest.mark.parametrize("argv,events_found,expected_exit,expected_calls", [
+        (['main.py', '--output', 'json'], True, 0, ['save_json']),
+        (['main.py', '--output', 'email', '--email', 'test@test.com'], True, 0, ['email']),
+        (['main.py', '--days', '14'], True, 0, ['save_json', 'days=14']),
+        (['main.py'], False, 1, ['save_json']),
+        (['main.py', '--output', 'both', '--email', 'test@test.com'], True, 0, ['save_json', 'email']),
+    ], ids=['json-output', 'email-output', 'custom-days', 'no-events-found', 'both-outputs'])
+    def test_main(self, mock_aggregator, argv, events_found, expected_exit, expected_calls):
+        """Test main function exit code and outputs for each command line"""
         events = []
+        if events_found:
+            events = [
+                Event(venue="Test", venue_url="https://test.com",
+                      name="Event", date=datetime.now() + timedelta(days=1))
+            ]
         mock_aggregator.scrape_all_venues.return_value = events
         mock_aggregator.deduplicate_events.return_value = events
         mock_aggregator.filter_upcoming_events.return_value = events
         
-        with pytest.raises(SystemExit):
-            main()
+        # Simulate the GitHub Actions environment, whose check only happens before emailing
+        with patch('sys.argv', argv), \
+                patch('main.save_events_json') as mock_save_json, \
+                patch('main.send_email', return_value=True) as mock_send_email, \
+                patch('os.getenv', return_value='true') as mock_getenv:
+            with pytest.raises(SystemExit) as exc_info:
+                main()
+                
+        assert exc_info.value.code == expected_exit
+        
+        if 'save_json' in expected_calls:
+            mock_save_json.assert_called_once_with(events, 'events.json')
+        else:
+            mock_save_json.assert_not_called()
             
-        # Check that filter was called with 14 days
-        mock_aggregator.filter_upcoming_events.assert_called_with(events, days=14)
-        
-    @patch('sys.argv', ['main.py'])
-    @patch('main.TechnoEventAggregator')
-    @patch('main.save_events_json')
-    def test_main_no_events_found(self, mock_save_json, mock_aggregator_class):
-        """Test main function when no events are found"""
-        mock_aggregator = MagicMock()
-        mock_aggregator_class.return_value = mock_aggregator
-        
-        # Return empty events
-        mock_aggregator.scrape_all_venues.return_value = []
-        mock_aggregator.deduplicate_events.return_value = []
-        mock_aggregator.filter_upcoming_events.return_value = []
-        
-        with pytest.raises(SystemExit) as exc_info:
-            main()
+        if 'email' in expected_calls:
+            mock_send_email.assert_called_once_with(events, 'test@test.com')
+            mock_getenv.assert_called_with('GITHUB_ACTIONS')
+        else:
+            mock_send_email.assert_not_called()
             
-        assert exc_info.value.code == 1  # Should exit with error code
-        
-    @patch('sys.argv', ['main.py', '--output', 'both', '--email', 'test@test.com'])
-    @patch('main.TechnoEventAggregator')
-    @patch('main.save_events_json')
-    @patch('main.send_email')
-    @patch('os.getenv')
-    def test_main_github_actions_mode(self, mock_getenv, mock_send_email, 
-                                     mock_save_json, mock_aggregator_class):
-        """Test main function in GitHub Actions environment"""
-        # Simulate GitHub Actions environment
-        mock_getenv.return_value = 'true'
-        
-        mock_aggregator = MagicMock()
-        mock_aggregator_class.return_value = mock_aggregator
-        
-        events = [
-            Event(venue="Test", venue_url="https://test.com",
-                  name="Event", date=datetime.now() + timedelta(days=1))
-        ]
-        mock_aggregator.scrape_all_venues.return_value = events
-        mock_aggregator.deduplicate_events.return_value = events
-        mock_aggregator.filter_upcoming_events.return_value = events
-        
-        mock_send_email.return_value = True
-        
-        with pytest.raises(SystemExit) as exc_info:
-            main()
-            
-        assert exc_info.value.code == 0
-        
-        # Should save JSON and send email
-        mock_save_json.assert_called_once()
-        mock_send_email.assert_called_once()
-        mock_getenv.assert_called_with('GITHUB_ACTIONS')
\ No newline at end of file
+        days = 14 if 'days=14' in expected_calls else 7
+        mock_aggregator.filter_upcoming_events.assert_called_once_with(events, days=days)
\ No newline at end of file
@@ -129,4 +129,53 @@ class TestEventModel:
         )
         
         assert event1 == event2
-        assert hash(event1) == hash(event2)
\ No newline at end of file
+        assert hash(event1) == hash(event2)
+        
+    def test_event_dedup_key(self):
+        """Test dedup key ignores name casing and time of day"""
+        event1 = Event(
+            venue="Shelter",
+            venue_url="https://test.com",
+            name="Techno Night",
+            date=datetime(2024, 3, 15, 23, 0)
+        )
+        
+        event2 = Event(
+            venue="Shelter",
+            venue_url="https://test.com",
+            name="TECHNO NIGHT",
+            date=datetime(2024, 3, 15, 22, 0)
+        )
+        
+        assert event1.dedup_key == ("Shelter", "techno night", datetime(2024, 3, 15).date())
+        assert event1.dedup_key == event2.dedup_key
+        
+    def test_event_dedup_key_casefolds_name(self):
+        """Test that names differing only by Unicode case variants are duplicates"""
+        event1 = Event(
+            venue="Shelter",
+            venue_url="https://test.com",
+            name="Straße Rave",
+            date=datetime(2024, 3, 15, 23, 0)
+        )
+        
+        event2 = Event(
+            venue="Shelter",
+            venue_url="https://test.com",
+            name="STRASSE RAVE",
+            date=datetime(2024, 3, 15, 23, 0)
+        )
+        
+        assert event1 == event2
+        assert hash(event1) == hash(event2)
+        
+    def test_event_rejects_unknown_fields(self):
+        """Test that misspelled fields are not silently dropped"""
+        with pytest.raises(TypeError):
+            Event(
+                venue="Shelter",
+                venue_url="https://test.com",
+                name="Techno Night",
+                date=datetime(2024, 3, 15, 23, 0),
+                lineup=["DJ One"]
+            )
@@ -9,8 +9,38 @@ from scrapers.lofi import LofiScraper
 from models.event import Event
 
 
+SHELTER_EVENT_HTML = """
+<html>
+    <body>
+        <h1>Techno Night with DJ Test</h1>
+        <div class="date">Saturday 15.03.2024</div>
+        <div class="lineup">
+            <p>DJ Test</p>
+            <p>Live Act</p>
+        </div>
+        <meta name="description" content="Underground techno event">
+    </body>
+</html>
+"""
+
+# Lofi event titles with the artists expected to be extracted from them
+LOFI_TITLE_CASES = [
+    ("Dekmantel presents DJ Rush", ["DJ Rush"]),
+    ("Vault Sessions invites Nina Kraviz b2b Helena Hauff", ["Nina Kraviz", "Helena Hauff"]),
+    ("STRAF_WERK: Ben Klock, DVS1, Surgeon", ["Ben Klock, DVS1, Surgeon"]),
+    ("Simple Event Name", []),
+    ("Label: Night presents DJ Rush", ["DJ Rush"])
+]
+
+
+@pytest.fixture(scope="module")
+def shelter_event_soup():
+    """Parsed Shelter detail page, shared because the scrapers only read from it"""
+    return BeautifulSoup(SHELTER_EVENT_HTML, "lxml")
+
+
 class TestShelterScraper:
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def scraper(self):
         return ShelterScraper()
         
@@ -66,18 +96,30 @@ class TestShelterScraper:
         assert any("techno" in event.name.lower() for event in events)
         
     @patch.object(ShelterScraper, 'fetch_page')
-    def test_parse_event_detail(self, mock_fetch, scraper):
+    def test_parse_event_detail(self, mock_fetch, scraper, shelter_event_soup):
         """Test parsing event detail page"""
+        mock_fetch.return_value = shelter_event_soup
+        
+        event = scraper._scrape_event_detail("https://test.com/event/test")
+        
+        assert event is not None
+        assert "Techno Night" in event.name
+        assert event.venue == "Shelter"
+        assert event.date.year >= 2024
+        
+    @patch.object(ShelterScraper, 'fetch_page')
+    def test_parse_event_detail_prefers_json_ld(self, mock_fetch, scraper):
+        """Test that a JSON-LD startDate wins over dates in the page text"""
         event_html = """
         <html>
+            <head>
+                <script type="application/ld+json">
+                    {"@context": "https://schema.org", "@type": "MusicEvent", "startDate": "2025-06-21T23:00:00+02:00"}
+                </script>
+            </head>
             <body>
-                <h1>Techno Night with DJ Test</h1>
-                <div class="date">Saturday 15.03.2024</div>
-                <div class="lineup">
-                    <p>DJ Test</p>
-                    <p>Live Act</p>
-                </div>
-                <meta name="description" content="Underground techno event">
+                <h1>Techno Night</h1>
+                <p>Tickets on sale until 01.01.2024</p>
             </body>
         </html>
         """
@@ -86,14 +128,31 @@ class TestShelterScraper:
         
         event = scraper._scrape_event_detail("https://test.com/event/test")
         
-        assert event is not None
-        assert "Techno Night" in event.name
-        assert event.venue == "Shelter"
-        assert event.date.year >= 2024
+        assert event.date == datetime(2025, 6, 21, 23, 0)
+        
+    @patch.object(ShelterScraper, 'fetch_page')
+    def test_parse_event_detail_converts_utc_json_ld(self, mock_fetch, scraper):
+        """Test that a UTC JSON-LD startDate is converted to Amsterdam time"""
+        event_html = """
+        <html>
+            <head>
+                <script type="application/ld+json">
+                    {"@context": "https://schema.org", "@type": "MusicEvent", "startDate": "2025-06-21T21:00:00Z"}
+                </script>
+            </head>
+            <body><h1>Techno Night</h1></body>
+        </html>
+        """
+        
+        mock_fetch.return_value = BeautifulSoup(event_html, "lxml")
+        
+        event = scraper._scrape_event_detail("https://test.com/event/test")
+        
+        assert event.date == datetime(2025, 6, 21, 23, 0)
 
 
 class TestRadionScraper:
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def scraper(self):
         return RadionScraper()
         
@@ -137,7 +196,7 @@ class TestRadionScraper:
 
 
 class TestLofiScraper:
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def scraper(self):
         return LofiScraper()
         
@@ -165,24 +224,32 @@ class TestLofiScraper:
         assert "Location: Courtyard" in event.description
         assert "Age: 18+" in event.description
         
-    def test_extract_artists_from_event_name(self, scraper):
+    def test_parse_event_container_with_time_element(self, scraper):
+        """Test that a <time datetime> attribute is used as the event date"""
+        container_html = """
+        <div class="event-item">
+            <h2>Warehouse Rave</h2>
+            <time datetime="2025-08-16T23:00">Sat 16 Aug</time>
+        </div>
+        """
+        
+        container = BeautifulSoup(container_html, "lxml").find("div")
+        event = scraper._parse_event_container(container)
+        
+        assert event.date == datetime(2025, 8, 16, 23, 0)
+        
+    @pytest.mark.parametrize("container,expected_artists", [
+        (BeautifulSoup(f'<div class="event"><h2>{event_name}</h2></div>', "lxml").find("div"), expected)
+        for event_name, expected in LOFI_TITLE_CASES
+    ], ids=[event_name for event_name, _ in LOFI_TITLE_CASES])
+    def test_extract_artists_from_event_name(self, scraper, container, expected_artists):
         """Test extracting artist names from event title"""
-        test_cases = [
-            ("Dekmantel presents DJ Rush", ["DJ Rush"]),
-            ("Vault Sessions invites Nina Kraviz b2b Helena Hauff", ["Nina Kraviz", "Helena Hauff"]),
-            ("STRAF_WERK: Ben Klock, DVS1, Surgeon", ["Ben Klock, DVS1, Surgeon"]),
-            ("Simple Event Name", [])
-        ]
+        event = scraper._parse_event_container(container)
         
-        for event_name, expected_artists in test_cases:
-            container_html = f'<div class="event"><h2>{event_name}</h2></div>'
-            container = BeautifulSoup(container_html, "lxml").find("div")
-            event = scraper._parse_event_container(container)
-            
-            if expected_artists:
-                assert len(event.artists) > 0
-                for artist in expected_artists:
-                    assert any(artist in found for found in event.artists)
+        if expected_artists:
+            assert len(event.artists) > 0
+            for artist in expected_artists:
+                assert any(artist in found for found in event.artists)
                     
     @patch.object(LofiScraper, 'fetch_page')
     def test_scrape_events_fallback_to_links(self, mock_fetch, scraper):
@@ -203,4 +270,24 @@ class TestLofiScraper:
         
         # Should find at least the techno event
         assert len(events) >= 1
-        assert any("techno" in event.name.lower() for event in events)
\ No newline at end of file
+        assert any("techno" in event.name.lower() for event in events)
+        
+    @patch.object(LofiScraper, 'fetch_page')
+    @pytest.mark.parametrize("listing_href", ["https://lofi.amsterdam/events/", "/events/"])
+    def test_scrape_events_fallback_skips_listing_link(self, mock_fetch, scraper, listing_href):
+        """Test that the fallback ignores the events listing page and unrelated links"""
+        html = f"""
+        <html>
+            <body>
+                <a href="{listing_href}">All Techno Events</a>
+                <a href="/event/techno-night">Techno Night</a>
+                <a href="/techno-blog">Techno Blog</a>
+            </body>
+        </html>
+        """
+        
+        mock_fetch.return_value = BeautifulSoup(html, "lxml")
+        
+        events = scraper.scrape_events()
+        
+        assert [event.url for event in events] == ["https://lofi.amsterdam/event/techno-night"]
\ No newline at end of file
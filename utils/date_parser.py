@@ -1,47 +1,123 @@
 import re
-from datetime import datetime, timedelta
-from typing import Optional
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from typing import Optional, Tuple
 from dateutil import parser as dateutil_parser
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Date shapes venues use most, tried with strptime before falling back to dateutil.
+# Numeric dates are day-first, as everywhere in the Netherlands.
+_FAST_FORMATS = (
+    '%d %B %Y', '%B %d, %Y', '%d/%m/%Y', '%d.%m.%Y', '%d %b %Y',
+    '%Y-%m-%d', '%A %d %B %Y', '%A %d.%m.%Y'
+)
 
-def parse_dutch_date(date_str: str) -> Optional[datetime]:
-    """Parse Dutch date formats commonly used by Amsterdam venues"""
-    
-    # Dutch month names
-    dutch_months = {
-        'januari': 1, 'februari': 2, 'maart': 3, 'april': 4,
-        'mei': 5, 'juni': 6, 'juli': 7, 'augustus': 8,
-        'september': 9, 'oktober': 10, 'november': 11, 'december': 12
-    }
-    
-    # Dutch day names (for reference)
-    dutch_days = {
-        'maandag': 'Monday', 'dinsdag': 'Tuesday', 'woensdag': 'Wednesday',
-        'donderdag': 'Thursday', 'vrijdag': 'Friday', 'zaterdag': 'Saturday',
-        'zondag': 'Sunday'
-    }
+# Bare numeric dates ("15.03.2024", "15/03/24", "2024-03-15") are split with one match
+# and built directly, without walking the strptime formats
+_NUMERIC_DATE_RE = re.compile(r'(\d{1,2})[./-](\d{1,2})[./-](\d{4}|\d{2})')
+_ISO_DATE_RE = re.compile(r'(\d{4})-(\d{1,2})-(\d{1,2})')
+
+
+def _parse_numeric_date(date_str: str) -> Optional[datetime]:
+    """Parse a date made of just day, month and year numbers, or None if it isn't one"""
+    match = _NUMERIC_DATE_RE.fullmatch(date_str)
+    if match:
+        day, month, year = map(int, match.groups())
+        if year < 100:
+            year += 2000
+    else:
+        match = _ISO_DATE_RE.fullmatch(date_str)
+        if not match:
+            return None
+        year, month, day = map(int, match.groups())
+        
+    try:
+        return datetime(year, month, day)
+    except ValueError:
+        # Out of range day or month
+        return None
+
+
+def _parse_known_format(date_str: str) -> Optional[datetime]:
+    """Parse date_str with the first matching exact format, or None if none match"""
+    parsed = _parse_numeric_date(date_str)
+    if parsed:
+        return parsed
+        
+    for fmt in _FAST_FORMATS:
+        try:
+            return datetime.strptime(date_str, fmt)
+        except ValueError:
+            pass
+    return None
+
+
+class _DutchParserInfo(dateutil_parser.parserinfo):
+    """dateutil's English month and day names plus their Dutch spellings"""
+    MONTHS = [names + (dutch,) for names, dutch in zip(dateutil_parser.parserinfo.MONTHS, (
+        'januari', 'februari', 'maart', 'april', 'mei', 'juni',
+        'juli', 'augustus', 'september', 'oktober', 'november', 'december'
+    ))]
+    WEEKDAYS = [names + (dutch,) for names, dutch in zip(dateutil_parser.parserinfo.WEEKDAYS, (
+        'maandag', 'dinsdag', 'woensdag', 'donderdag', 'vrijdag', 'zaterdag', 'zondag'
+    ))]
+
+
+# One parser for both languages, so Dutch dates need no translation pass
+_PARSER = dateutil_parser.parser(_DutchParserInfo())
+
+
+def parse_date_fast(date_str: str) -> datetime:
+    """Parse a scraped date string, trying cheap exact formats before fuzzy parsing
     
-    # Clean the string
-    date_str = date_str.strip().lower()
+    Raises ValueError if the string cannot be parsed at all.
+    """
+    cleaned = date_str.strip()
+    return _parse_known_format(cleaned) or _PARSER.parse(cleaned, fuzzy=True)
+
+
+_YEAR_RE = re.compile(r'\b\d{4}\b')
+
+# Relative date keywords; longer words first so "overmorgen" isn't read as "morgen"
+_RELATIVE_RE = re.compile(
+    r'overmorrow|overmorgen|tomorrow|morgen|today|vandaag|this\s+weekend|dit\s+weekend', re.I
+)
+_RELATIVE_OFFSETS = {
+    'today': 0, 'vandaag': 0,
+    'tomorrow': 1, 'morgen': 1,
+    'overmorrow': 2, 'overmorgen': 2,
+}
+
+
+@lru_cache(maxsize=4096)
+def _parse_absolute_date(date_str: str, day: date) -> Optional[Tuple[datetime, bool]]:
+    """Parse a non-relative date and report whether it names a year, or None if it can't be parsed
     
-    # Replace Dutch month names with English
-    for dutch, english_num in dutch_months.items():
-        if dutch in date_str:
-            # Replace with English month name for parsing
-            english_month = datetime(2000, english_num, 1).strftime('%B').lower()
-            date_str = date_str.replace(dutch, english_month)
-            
-    # Replace Dutch day names
-    for dutch, english in dutch_days.items():
-        date_str = date_str.replace(dutch, english.lower())
-        
+    Many events share the same date string, so results are cached. Missing fields and
+    bare weekdays are filled in from day, which is therefore part of the cache key; the
+    year roll-over is applied by the caller.
+    """
+    # _PARSER reads English and Dutch names alike, so there is no separate Dutch attempt
     try:
-        return dateutil_parser.parse(date_str, fuzzy=True)
+        parsed = _parse_known_format(date_str) or _PARSER.parse(
+            date_str, default=datetime(day.year, day.month, day.day), fuzzy=True
+        )
     except:
         return None
+        
+    return parsed, bool(_YEAR_RE.search(date_str))
+
+
+def parse_dutch_date(date_str: str, reference_date: Optional[datetime] = None) -> Optional[datetime]:
+    """Parse Dutch date formats commonly used by Amsterdam venues (results are cached)
+    
+    Missing fields and bare weekdays are taken relative to reference_date (defaults to now).
+    """
+    day = (reference_date or datetime.now()).date()
+    absolute = _parse_absolute_date(date_str.strip(), day)
+    return absolute[0] if absolute else None
 
 
 def parse_event_date(date_str: str, reference_date: Optional[datetime] = None) -> datetime:
@@ -61,65 +137,59 @@ def parse_event_date(date_str: str, reference_date: Optional[datetime] = None) -
     # Clean the input
     date_str = date_str.strip()
     
-    # Try standard parsing first
-    try:
-        parsed = dateutil_parser.parse(date_str, fuzzy=True)
+    # Try standard parsing first, then Dutch date parsing
+    absolute = _parse_absolute_date(date_str, reference_date.date())
+    if absolute:
+        parsed, has_year = absolute
         
         # If the parsed date is in the past and doesn't have a year specified,
         # assume it's for next year
-        if parsed < reference_date:
-            # Check if year was explicitly mentioned
-            if not re.search(r'\b\d{4}\b', date_str):
-                parsed = parsed.replace(year=reference_date.year + 1)
-                
+        if parsed < reference_date and not has_year:
+            parsed = parsed.replace(year=reference_date.year + 1)
+            
         return parsed
         
-    except:
-        pass
-        
-    # Try Dutch date parsing
-    dutch_parsed = parse_dutch_date(date_str)
-    if dutch_parsed:
-        # Same future date logic
-        if dutch_parsed < reference_date and not re.search(r'\b\d{4}\b', date_str):
-            dutch_parsed = dutch_parsed.replace(year=reference_date.year + 1)
-        return dutch_parsed
-        
     # Handle relative dates
-    relative_patterns = {
-        r'today|vandaag': 0,
-        r'tomorrow|morgen': 1,
-        r'overmorrow|overmorgen': 2,
-        r'this\s+weekend|dit\s+weekend': None,  # Special handling
-    }
-    
-    for pattern, days_offset in relative_patterns.items():
-        if re.search(pattern, date_str.lower()):
-            if days_offset is not None:
-                return reference_date + timedelta(days=days_offset)
-            elif 'weekend' in pattern:
-                # Find next weekend (Friday)
-                days_until_friday = (4 - reference_date.weekday()) % 7
-                if days_until_friday == 0 and reference_date.hour >= 18:
-                    days_until_friday = 7
-                return reference_date + timedelta(days=days_until_friday)
-                
+    match = _RELATIVE_RE.search(date_str)
+    if match:
+        days_offset = _RELATIVE_OFFSETS.get(match.group(0).lower())
+        if days_offset is not None:
+            return reference_date + timedelta(days=days_offset)
+            
+        # "this weekend": find next weekend (Friday)
+        days_until_friday = (4 - reference_date.weekday()) % 7
+        if days_until_friday == 0 and reference_date.hour >= 18:
+            days_until_friday = 7
+        return reference_date + timedelta(days=days_until_friday)
+        
     # Last resort: return reference date
     logger.warning(f"Could not parse date: {date_str}, using reference date")
     return reference_date
 
 
+# Time ranges like "23:00 - 06:00", "2300-0600" or "23 uur - 6 uur", or "11pm - 6am".
+# One alternation so the text is scanned once; the am/pm groups tell the arms apart.
+_TIME_RANGE_RE = re.compile(
+    r'(\d{1,2}):?(\d{2})?\s*(?:hrs?|hours?|uur)?\s*[-–]\s*(\d{1,2}):?(\d{2})?\s*(?:hrs?|hours?|uur)?'
+    r'|(\d{1,2})\s*([ap]m)\s*[-–]\s*(\d{1,2})\s*([ap]m)',
+    re.I
+)
+
+
 def extract_time_info(text: str) -> Optional[dict]:
     """Extract time information from event text"""
     time_info = {}
     
-    # Pattern for time ranges like "23:00 - 06:00" or "11pm - 6am"
-    time_pattern = r'(\d{1,2}):?(\d{2})?\s*(?:hrs?|hours?|uur)?\s*[-–]\s*(\d{1,2}):?(\d{2})?\s*(?:hrs?|hours?|uur)?'
-    am_pm_pattern = r'(\d{1,2})\s*([ap]m)\s*[-–]\s*(\d{1,2})\s*([ap]m)'
-    
-    # Search for 24-hour format
-    match = re.search(time_pattern, text, re.I)
-    if match:
+    # Every time range has a dash; most descriptions don't, so skip the regex for them
+    if '-' not in text and '–' not in text:
+        return None
+        
+    match = _TIME_RANGE_RE.search(text)
+    if not match:
+        return None
+        
+    # 24-hour format
+    if match.group(1):
         start_hour = int(match.group(1))
         start_min = int(match.group(2)) if match.group(2) else 0
         end_hour = int(match.group(3))
@@ -129,27 +199,23 @@ def extract_time_info(text: str) -> Optional[dict]:
         time_info['end_time'] = f"{end_hour:02d}:{end_min:02d}"
         return time_info
         
-    # Search for AM/PM format
-    match = re.search(am_pm_pattern, text, re.I)
-    if match:
-        start_hour = int(match.group(1))
-        start_period = match.group(2).lower()
-        end_hour = int(match.group(3))
-        end_period = match.group(4).lower()
+    # AM/PM format
+    start_hour = int(match.group(5))
+    start_period = match.group(6).lower()
+    end_hour = int(match.group(7))
+    end_period = match.group(8).lower()
+    
+    # Convert to 24-hour format
+    if start_period == 'pm' and start_hour != 12:
+        start_hour += 12
+    elif start_period == 'am' and start_hour == 12:
+        start_hour = 0
         
-        # Convert to 24-hour format
-        if start_period == 'pm' and start_hour != 12:
-            start_hour += 12
-        elif start_period == 'am' and start_hour == 12:
-            start_hour = 0
-            
-        if end_period == 'pm' and end_hour != 12:
-            end_hour += 12
-        elif end_period == 'am' and end_hour == 12:
-            end_hour = 0
-            
-        time_info['start_time'] = f"{start_hour:02d}:00"
-        time_info['end_time'] = f"{end_hour:02d}:00"
-        return time_info
+    if end_period == 'pm' and end_hour != 12:
+        end_hour += 12
+    elif end_period == 'am' and end_hour == 12:
+        end_hour = 0
         
-    return None
\ No newline at end of file
+    time_info['start_time'] = f"{start_hour:02d}:00"
+    time_info['end_time'] = f"{end_hour:02d}:00"
+    return time_info
\ No newline at end of file
@@ -3,26 +3,79 @@ import json
 import smtplib
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
+from collections import defaultdict
 from datetime import datetime
-from typing import List
+from operator import attrgetter
+from typing import Dict, List, NamedTuple, Optional, Union
 import logging
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
 from models.event import Event
 
 logger = logging.getLogger(__name__)
 
+# English names regardless of the process locale, and cheaper than strftime per event
+_WEEKDAYS = ('Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday')
+_MONTHS = ('January', 'February', 'March', 'April', 'May', 'June', 'July',
+           'August', 'September', 'October', 'November', 'December')
+
+# Kept open between sends so repeated digests skip the TCP/STARTTLS/AUTH handshake
+_smtp_connection: Optional[smtplib.SMTP] = None
+_smtp_connection_key: Optional[tuple] = None
+
+
+def _format_event_date(date: datetime) -> str:
+    """Format a date like 'Friday, March 15 at 23:00'"""
+    return (f"{_WEEKDAYS[date.weekday()]}, {_MONTHS[date.month - 1]} {date.day:02d} "
+            f"at {date.hour:02d}:{date.minute:02d}")
+
+
+class _RenderedEvent(NamedTuple):
+    """Display strings for one event, shared by the HTML and text bodies"""
+    name: str
+    date_str: str
+    artists_str: Optional[str]
+    url: Optional[str]
+
+
+def _render_events(events: List[Event]) -> Dict[str, List[_RenderedEvent]]:
+    """Render events' display fields once, grouped by venue in date order"""
+    events_by_venue = defaultdict(list)
+    for event in sorted(events, key=attrgetter('date')):
+        artists_str = None
+        if event.artists:
+            artists_str = ", ".join(event.artists[:5])
+            if len(event.artists) > 5:
+                artists_str += f" +{len(event.artists) - 5} more"
+                
+        events_by_venue[event.venue].append(_RenderedEvent(
+            name=event.name,
+            date_str=_format_event_date(event.date),
+            artists_str=artists_str,
+            url=event.url
+        ))
+    return events_by_venue
+
 
 def format_events_html(events: List[Event]) -> str:
     """Format events into an HTML email body"""
+    return _format_html(_render_events(events))
+
+
+def format_events_text(events: List[Event]) -> str:
+    """Format events into plain text"""
+    return _format_text(_render_events(events))
+
+
+def _format_html(events_by_venue: Dict[str, List[_RenderedEvent]]) -> str:
+    """HTML email body for pre-rendered events"""
     
-    # Group events by venue
-    events_by_venue = {}
-    for event in sorted(events, key=lambda e: e.date):
-        if event.venue not in events_by_venue:
-            events_by_venue[event.venue] = []
-        events_by_venue[event.venue].append(event)
-    
-    html = """
+    # Collect fragments and join once instead of re-copying the document on every +=
+    parts = ["""
     <html>
     <head>
         <style>
@@ -42,28 +95,26 @@ def format_events_html(events: List[Event]) -> str:
     <body>
         <div class="container">
             <h1>🎵 Amsterdam Techno Events This Week</h1>
-    """
+    """]
+    append = parts.append
     
     for venue, venue_events in events_by_venue.items():
-        html += f'<h2>{venue}</h2>'
+        append(f'<h2>{venue}</h2>')
         
         for event in venue_events:
-            html += '<div class="event">'
-            html += f'<div class="event-name">{event.name}</div>'
-            html += f'<div class="event-date">📅 {event.date.strftime("%A, %B %d at %H:%M")}</div>'
+            append('<div class="event">')
+            append(f'<div class="event-name">{event.name}</div>')
+            append(f'<div class="event-date">📅 {event.date_str}</div>')
             
-            if event.artists:
-                artists_str = ", ".join(event.artists[:5])
-                if len(event.artists) > 5:
-                    artists_str += f" +{len(event.artists) - 5} more"
-                html += f'<div class="event-artists">🎧 {artists_str}</div>'
+            if event.artists_str:
+                append(f'<div class="event-artists">🎧 {event.artists_str}</div>')
             
             if event.url:
-                html += f'<div><a href="{event.url}" class="event-link">View Event Details →</a></div>'
+                append(f'<div><a href="{event.url}" class="event-link">View Event Details →</a></div>')
             
-            html += '</div>'
+            append('</div>')
     
-    html += """
+    append("""
             <div class="footer">
                 <p>Stay underground, stay informed! 🖤</p>
                 <p>This email was generated by the Amsterdam Techno Agent</p>
@@ -71,52 +122,81 @@ def format_events_html(events: List[Event]) -> str:
         </div>
     </body>
     </html>
-    """
+    """)
     
-    return html
+    return "".join(parts)
 
 
-def format_events_text(events: List[Event]) -> str:
-    """Format events into plain text"""
+def _format_text(events_by_venue: Dict[str, List[_RenderedEvent]]) -> str:
+    """Plain text email body for pre-rendered events"""
     
-    # Group events by venue
-    events_by_venue = {}
-    for event in sorted(events, key=lambda e: e.date):
-        if event.venue not in events_by_venue:
-            events_by_venue[event.venue] = []
-        events_by_venue[event.venue].append(event)
-    
-    text = "AMSTERDAM TECHNO EVENTS THIS WEEK\n"
-    text += "=" * 40 + "\n\n"
+    parts = ["AMSTERDAM TECHNO EVENTS THIS WEEK\n", "=" * 40 + "\n\n"]
+    append = parts.append
     
     for venue, venue_events in events_by_venue.items():
-        text += f"\n{venue.upper()}\n"
-        text += "-" * len(venue) + "\n\n"
+        append(f"\n{venue.upper()}\n")
+        append("-" * len(venue) + "\n\n")
         
         for event in venue_events:
-            text += f"📅 {event.date.strftime('%A, %B %d at %H:%M')}\n"
-            text += f"   {event.name}\n"
+            append(f"📅 {event.date_str}\n")
+            append(f"   {event.name}\n")
             
-            if event.artists:
-                artists_str = ", ".join(event.artists[:5])
-                if len(event.artists) > 5:
-                    artists_str += f" +{len(event.artists) - 5} more"
-                text += f"   Artists: {artists_str}\n"
+            if event.artists_str:
+                append(f"   Artists: {event.artists_str}\n")
             
             if event.url:
-                text += f"   Link: {event.url}\n"
+                append(f"   Link: {event.url}\n")
             
-            text += "\n"
+            append("\n")
+    
+    append("\n" + "-" * 40 + "\n")
+    append("Stay underground, stay informed!\n")
+    append("Generated by the Amsterdam Techno Agent\n")
     
-    text += "\n" + "-" * 40 + "\n"
-    text += "Stay underground, stay informed!\n"
-    text += "Generated by the Amsterdam Techno Agent\n"
+    return "".join(parts)
+
+
+def _get_smtp(smtp_config: dict) -> smtplib.SMTP:
+    """Logged-in SMTP connection for smtp_config, reusing the cached one while it is alive"""
+    global _smtp_connection, _smtp_connection_key
+    
+    key = (smtp_config['server'], smtp_config['port'], smtp_config['username'])
+    if _smtp_connection is not None:
+        if _smtp_connection_key == key:
+            try:
+                if _smtp_connection.noop()[0] == 250:
+                    return _smtp_connection
+            except (smtplib.SMTPException, OSError):
+                pass
+        close_smtp()
+        
+    server = smtplib.SMTP(smtp_config['server'], smtp_config['port'])
+    try:
+        server.starttls()
+        server.login(smtp_config['username'], smtp_config['password'])
+    except Exception:
+        server.close()
+        raise
+        
+    _smtp_connection, _smtp_connection_key = server, key
+    return server
+
+
+def close_smtp():
+    """Close the cached SMTP connection, if one is open"""
+    global _smtp_connection, _smtp_connection_key
     
-    return text
+    if _smtp_connection is not None:
+        try:
+            _smtp_connection.quit()
+        except (smtplib.SMTPException, OSError):
+            _smtp_connection.close()
+            
+    _smtp_connection = _smtp_connection_key = None
 
 
-def send_email(events: List[Event], recipient: str, smtp_config: dict = None):
-    """Send email with events listing"""
+def send_email(events: List[Event], recipient: Union[str, List[str]], smtp_config: dict = None):
+    """Send email with events listing to one or more recipients"""
     
     if not smtp_config:
         # Try to get from environment variables
@@ -132,40 +212,49 @@ def send_email(events: List[Event], recipient: str, smtp_config: dict = None):
         logger.error("SMTP credentials not configured")
         return False
     
+    recipients = [recipient] if isinstance(recipient, str) else list(recipient)
+    from_email = smtp_config.get('from_email') or smtp_config['username']
+    
     try:
         # Create message
         msg = MIMEMultipart('alternative')
         msg['Subject'] = f"Amsterdam Techno Events - {datetime.now().strftime('%B %d, %Y')}"
-        msg['From'] = smtp_config.get('from_email', smtp_config['username'])
-        msg['To'] = recipient
+        msg['From'] = from_email
+        msg['To'] = ", ".join(recipients)
         
-        # Create text and HTML parts
-        text_part = MIMEText(format_events_text(events), 'plain')
-        html_part = MIMEText(format_events_html(events), 'html')
+        # Create text and HTML parts from one rendering of the events
+        rendered = _render_events(events)
+        text_part = MIMEText(_format_text(rendered), 'plain')
+        html_part = MIMEText(_format_html(rendered), 'html')
         
         msg.attach(text_part)
         msg.attach(html_part)
         
-        # Send email
-        with smtplib.SMTP(smtp_config['server'], smtp_config['port']) as server:
-            server.starttls()
-            server.login(smtp_config['username'], smtp_config['password'])
-            server.send_message(msg)
-            
-        logger.info(f"Email sent successfully to {recipient}")
+        # Serialize once; a single transaction delivers it to every recipient
+        server = _get_smtp(smtp_config)
+        server.sendmail(from_email, recipients, msg.as_bytes())
+        
+        logger.info(f"Email sent successfully to {msg['To']}")
         return True
         
     except Exception as e:
         logger.error(f"Failed to send email: {e}")
+        # Don't hand a connection in an unknown state to the next send
+        close_smtp()
         return False
 
 
 def save_events_json(events: List[Event], filename: str = "events.json"):
     """Save events to a JSON file for debugging"""
     
-    events_data = [event.dict() for event in events]
+    # Encode the whole document first so it goes out in a single write
+    if orjson is not None:
+        # Events are dataclasses, which orjson serializes natively (skipping _private fields)
+        payload = orjson.dumps(events, option=orjson.OPT_INDENT_2)
+    else:
+        payload = json.dumps([event.to_dict() for event in events], ensure_ascii=False, indent=2).encode('utf-8')
     
-    with open(filename, 'w', encoding='utf-8') as f:
-        json.dump(events_data, f, indent=2, ensure_ascii=False, default=str)
+    with open(filename, 'wb') as f:
+        f.write(payload)
         
     logger.info(f"Saved {len(events)} events to {filename}")
\ No newline at end of file